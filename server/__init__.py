@@ -6,23 +6,17 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
+# server.models imports every table model, which registers them all for table creation.
+import server.models  # pylint:disable=unused-import
 from server.config import Config
-from server.db import async_create_all_tables
-
-# Import tables for creation here.
-from server.models import (
-    ScanningSession,
-    Secret,
-    StreamCategory,
-    StreamViewerListFetch,
-    SuspectedBot,
-    TwitchUserData,
-    ViewerSighting,
-)
+from server.db import async_create_all_tables, async_dispose_engine
 from server.routes import router
 from server.utils import setup_logging
 
+__all__ = ["app", "create_app"]
+
 CERT_FILE_PATH = "/secrets/cert.pem"
 KEY_FILE_PATH = "/secrets/key.pem"
 
@@ -30,7 +24,10 @@ CERT_PASSKEY = str(os.getenv("CERT_PASSKEY"))
 if not CERT_PASSKEY:
     raise EnvironmentError("CERT_PASSKEY environment variable not set")
 
-# Logger setup outside of create_app
+# Config and logger setup happen once at import, outside of create_app, so they aren't redone
+# per app instance. (Config.initialize() is idempotent; server.db may already have called it.)
+Config.initialize()
+
 # if Config.ENVIRONMENT == "container":
 # Currently only run in a container, FastAPI hates running in WSL Python 3.12 local anyway.
 # If I want this to run in local, I need to massage out how I'm handling the logging path.
@@ -40,6 +37,7 @@ setup_logging(Config.LOGGING_CONFIG_FILE)
 logging.getLogger("asyncio").setLevel(logging.WARNING)
 # debug log-lines about caching the sha2
 logging.getLogger("aiomysql").setLevel(logging.WARNING)
+logging.getLogger("asyncmy").setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)  # Set to debug level to capture detailed logs
@@ -52,24 +50,26 @@ async def lifespan(
 ) -> AsyncGenerator[None, None]:
     # Startup events
     logger.info("SERVER START")
-    await async_create_all_tables()
+    if Config.SCHEMA_INITIALIZED:
+        logger.info("Schema already initialized, skipping table creation.")
+    else:
+        await async_create_all_tables()
 
     yield  # this allows the server to run
 
     # Shutdown event
     # Add any necessary cleanup code here
+    await async_dispose_engine()
     logger.info("SERVER STOP")
 
 
 def create_app() -> FastAPI:
-    fastapi_app = FastAPI(lifespan=lifespan)
+    fastapi_app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
-    Config.initialize()
     fastapi_app.debug = False
 
-    # Log the worker PID
-    worker_pid = os.getpid()
-    logger.info(f"Worker PID: {worker_pid}")
+    # Log the worker PID; every record also carries it via %(process)d in the log format.
+    logger.info("Worker PID: %s", os.getpid())
 
     fastapi_app.include_router(router)
 
@@ -4,7 +4,8 @@ from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 import aiohttp
-from pydantic import ValidationError
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from server.models import (
     GetStreamResponse,
@@ -15,6 +16,11 @@ from server.models import (
 
 logger = logging.getLogger("__name__")
 
+# Built once: validating a whole response's list in one call beats a Model(**d) per entry.
+_STREAMS_ADAPTER = TypeAdapter(list[GetStreamResponse])
+_USERS_ADAPTER = TypeAdapter(list[TwitchUserDataCreate])
+_CATEGORIES_ADAPTER = TypeAdapter(list[StreamCategoryCreate])
+
 
 class TwitchAPIDelegateError(Exception):
     pass
@@ -63,7 +69,7 @@ async def make_request(
             if response.status != 200:
                 logger.error(f"Failed to make request: {response.status}")
                 return {"error": response.status, "message": await response.text()}
-            return await response.json()
+            return await response.json(loads=orjson.loads)
 
 
 def response_error_check(response: dict[str, Any]):
@@ -109,9 +115,7 @@ async def get_streams(
     try:
         streams_data = response.get("data", [])
         pagination_cursor: str = response.get("pagination", {}).get("cursor", "")
-        streams: list[GetStreamResponse] = [
-            GetStreamResponse(**stream) for stream in streams_data
-        ]
+        streams = _STREAMS_ADAPTER.validate_python(streams_data)
         return streams, pagination_cursor
     except ValidationError as e:
         logger.error(f"Error parsing response: {e}")
@@ -130,7 +134,7 @@ async def get_users(
 
     try:
         users_data = response.get("data", [])
-        return [TwitchUserDataCreate(**user) for user in users_data]
+        return _USERS_ADAPTER.validate_python(users_data)
     except ValidationError as e:
         logger.error(f"Error parsing response: {e}")
         raise
@@ -160,7 +164,7 @@ async def revitalize_tokens(
                 if response.status != 200:
                     logger.error(f"Failed to refresh token: {response.status}")
                     return {"error": response.status, "message": await response.text()}
-                return await response.json()
+                return await response.json(loads=orjson.loads)
             except TwitchAPIDelegateError as e:
                 raise TwitchAPIDelegateTokenRefresh(
                     f"Failed to refresh tokens. {str(e)}"
@@ -214,7 +218,7 @@ async def get_categories(
     try:
         categories_data = response.get("data", [])
         logger.debug(f"{categories_data=}")
-        categories = [StreamCategoryCreate(**category) for category in categories_data]
+        categories = _CATEGORIES_ADAPTER.validate_python(categories_data)
         logger.debug(f"{categories=}")
         return categories
     except ValidationError as e:
@@ -237,7 +241,7 @@ async def get_app_access_token(config: TwitchAPIConfig) -> Dict[str, Any]:
                 raise TwitchAPIDelegateError(
                     f"Failed to get app access token: {response.status}"
                 )
-            data = await response.json()
+            data = await response.json(loads=orjson.loads)
             return {
                 "access_token": data.get("access_token"),
                 "expires_in": data.get("expires_in"),
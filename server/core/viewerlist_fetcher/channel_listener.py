@@ -48,19 +48,13 @@ References:
 
 import asyncio
 import logging
+import sys
 from dataclasses import dataclass, field
 from time import perf_counter
-from typing import Optional, Set, Tuple
+from typing import Callable, Optional, Set, Tuple
 
 from twitchio import Client
-from twitchio.errors import (
-    AuthenticationError,
-    HTTPException,
-    InvalidContent,
-    IRCCooldownError,
-    TwitchIOException,
-    Unauthorized,
-)
+from twitchio.errors import TwitchIOException
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +62,11 @@ logger = logging.getLogger(__name__)
 # These correspond to RFC 1459 / IRC protocol
 IRC_CHATTER_LIST_MSG = "353"
 IRC_END_OF_NAMES_MSG = "366"
+# IRC puts a single space on either side of the command, so padding the tokens keeps us from
+# matching digits in a user name or a JOIN in a message body.
+_CHATTER_LIST_TOKEN = f" {IRC_CHATTER_LIST_MSG} "
+_END_OF_NAMES_TOKEN = f" {IRC_END_OF_NAMES_MSG} "
+_JOIN_TOKEN = " JOIN "
 
 OVERALL_TIMEOUT = 10.0  # fractional seconds a la perf_counter
 
@@ -88,7 +87,7 @@ class VLFetcherOvertimeError(VLFetcherError):
     """Return if overall timeout exceeded."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ViewerListFetchData:
     user_names: Set[str] = field(default_factory=set)
     done: bool = False
@@ -96,6 +95,8 @@ class ViewerListFetchData:
     end_time: Optional[float] = None
     time_elapsed: Optional[float] = None
     error: Optional[Exception] = None
+    # Set by mark_done(); this is what _wait_for_user_list() awaits.
+    done_event: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
 
     def calculate_final_time_elapsed(self):
         if self.start_time is not None and self.end_time is not None:
@@ -104,6 +105,15 @@ class ViewerListFetchData:
     def calculate_time_elapsed(self) -> float:
         return perf_counter() - self.start_time
 
+    def mark_done(self, error: Optional[Exception] = None):
+        """Stop the clock, record any error, and wake whoever is waiting on this channel."""
+        self.end_time = perf_counter()
+        self.calculate_final_time_elapsed()
+        if error is not None:
+            self.error = error
+        self.done = True
+        self.done_event.set()
+
 
 class ViewerListFetcherChannelListener(Client):
     """Core code to process one or more given channels. For each channel given:
@@ -117,7 +127,8 @@ class ViewerListFetcherChannelListener(Client):
         - Pass channels in a list to fetch_viewer_list_for_channels() and await response, which will
           be:
             Tuple[dict[str, ViewerListFetchData], float]:
-                - A dict mapping channel_name to ViewerListFetchData
+                - A dict mapping channel_name to ViewerListFetchData. The caller owns it; the
+                  listener doesn't keep a reference.
                 - The total time this call took to join, fetch, and part from all given channels, in
                   seconds.
     """
@@ -148,6 +159,13 @@ class ViewerListFetcherChannelListener(Client):
 
         self._ready_event = asyncio.Event()
 
+        # IRC command -> parser for the raw messages we care about. Each returns the channel name.
+        self._raw_data_handlers: dict[str, Callable[[str], str]] = {
+            "JOIN": self._process_join_message,
+            IRC_CHATTER_LIST_MSG: self._process_chatter_list_message,
+            IRC_END_OF_NAMES_MSG: self._process_end_of_names,
+        }
+
         super().__init__(token=self._access_token, initial_channels=[])
 
     async def event_ready(self):
@@ -165,7 +183,7 @@ class ViewerListFetcherChannelListener(Client):
         # single user join
         # :username!username@username.tmi.twitch.tv JOIN #channel_name
         channel_name: str = msg.split("#")[1].strip()
-        username: str = msg.split("!")[0][1:].strip()
+        username: str = sys.intern(msg.split("!")[0][1:].strip())
         logger.info(f"Received JOIN: {channel_name=} {username=}")
         self._user_lists[channel_name].user_names.add(username)
         return channel_name
@@ -187,24 +205,24 @@ class ViewerListFetcherChannelListener(Client):
 
         # Extract the channel name and user list from the 353 message. Here's a sample:
         # ":user!user@user.tmi.twitch.tv 353 this_bot = #channel :jane jack jill"
-        # We split on the colons
-        # [0] = ""
-        # [1] = the prefix including the 353 and the name of our bot here.
-        # [2] = the space-separated user list
-        parts = msg.split(":")
-        if len(parts) > 2:
-            # msg_parts ['user!user@user.tmi.twitch.tv', '353', 'this_bot', '=', '#channel']
-            msg_parts = parts[1].strip().split()
-            channel_name = msg_parts[-1].lstrip("#")
+        # The first " :" is the IRC trailing-parameter separator, so one partition gives us
+        # head = ":user!user@user.tmi.twitch.tv 353 this_bot = #channel"
+        # names = "jane jack jill"
+        # and the channel is the last token of head.
+        head, separator, names = msg.partition(" :")
+        if separator:
+            channel_name = head[head.rfind(" ") + 1 :].lstrip("#")
             if channel_name not in self._user_lists:
                 raise VLFetcherError(
                     f"VLFetcher {self._worker_id} channel not in user_list error {channel_name}"
                 )
 
-            user_list = set(parts[2].split())
+            # Interned: the same logins show up across channels and batches all scan long, and
+            # they end up as set members and dict keys downstream.
+            user_list = [sys.intern(name) for name in names.split()]
             self._user_lists[channel_name].user_names.update(user_list)
             logger.info(
-                f"{self._worker_id} added names from {channel_name}: {list(user_list)}"
+                f"{self._worker_id} added names from {channel_name}: {user_list}"
             )
             return channel_name
         raise VLFetcherError(
@@ -218,17 +236,13 @@ class ViewerListFetcherChannelListener(Client):
             str: The channel name, if successfully parsed.
         """
         # Part from the channel after receiving the 366 indicating end-of-353 messages.
-        # We split as above, except this time [2] is the end of names message.
-        parts = msg.split(":")
-        logger.debug(f"split {len(parts)} pieces: {parts}")
-        if len(parts) > 2:
-            # message = "this_bot:tmi.twitch.tv 366 this_bot channel :End of /NAMES list"
-            # parts == ['this_bot', 'tmi.twitch.tv 366 this_bot my_channel ', 'End of /NAMES list']
-            # msg_parts == ['tmi.twitch.tv', '366', 'this_bot', 'channel']
-            msg_parts = parts[1].strip().split()
-            channel_name = msg_parts[-1].lstrip("#")
-            # end_of_names_msg = parts[2].split()
-            print(f"Will part from channel: {channel_name}")
+        # We partition as above, except this time the trailing part is the end of names message.
+        # message = "this_bot:tmi.twitch.tv 366 this_bot channel :End of /NAMES list"
+        # head == "this_bot:tmi.twitch.tv 366 this_bot channel"
+        head, separator, _ = msg.partition(" :")
+        if separator:
+            channel_name = head[head.rfind(" ") + 1 :].lstrip("#")
+            logger.debug(f"Will part from channel: {channel_name}")
             return channel_name
         raise VLFetcherError(
             f"Failed to parse {IRC_END_OF_NAMES_MSG} end-of-names message."
@@ -243,22 +257,14 @@ class ViewerListFetcherChannelListener(Client):
             logger.debug(
                 f"{channel_name} to be parted from. {self._user_lists.keys()=}"
             )
-            self._user_lists[channel_name].end_time = perf_counter()
-            self._user_lists[channel_name].calculate_final_time_elapsed()
-            self._user_lists[channel_name].done = True
+            self._user_lists[channel_name].mark_done()
             await self.part_channels(channel_name)
         except KeyError as e:
             raise VLFetcherChannelPartError(
                 f"The channel {channel_name} is not in {self._user_lists.keys()=}"
             ) from e
-        except (
-            HTTPException,
-            InvalidContent,
-            AuthenticationError,
-            IRCCooldownError,
-            TwitchIOException,
-            Unauthorized,
-        ) as e:
+        # TwitchIOException is the base of HTTPException, Unauthorized, IRCCooldownError, etc.
+        except TwitchIOException as e:
             self._user_lists[channel_name].error = e
             raise VLFetcherChannelPartError() from e
 
@@ -269,6 +275,15 @@ class ViewerListFetcherChannelListener(Client):
         responded to.
         """
         logger.debug(f"TwitchIO Chat Client raw data: {data}")  # the nuclear option
+
+        # Most frames (PING, PRIVMSG, etc.) are nothing we care about; bail before doing any work.
+        if (
+            _CHATTER_LIST_TOKEN not in data
+            and _END_OF_NAMES_TOKEN not in data
+            and _JOIN_TOKEN not in data
+        ):
+            return
+
         logger.debug(f"{self._user_lists.keys()=}")
 
         # Messages can arrive in tandem, e.g. multiple 353s and a 366 in one line; when this
@@ -291,16 +306,19 @@ class ViewerListFetcherChannelListener(Client):
         end_of_names_received = False
         channel_name: Optional[str] = None
         for submessage in submessages:
+            # The command is the second token, after the prefix:
+            # ":user!user@user.tmi.twitch.tv JOIN #channel"
+            tokens = submessage.split(" ", 2)
+            if len(tokens) < 2:
+                continue
+            command = tokens[1]
+            handler = self._raw_data_handlers.get(command)
+            if handler is None:
+                continue
             try:
-                if "JOIN" in submessage:
-                    logger.debug(f"IN JOIN CLOSURE: {submessage=}")
-                    channel_name = self._process_join_message(submessage)
-                if IRC_CHATTER_LIST_MSG in submessage:
-                    logger.debug(f"IN 353 CLOSURE: {submessage=}")
-                    channel_name = self._process_chatter_list_message(submessage)
-                if IRC_END_OF_NAMES_MSG in submessage:
-                    logger.debug(f"IN 366 CLOSURE: {submessage=}")
-                    channel_name = self._process_end_of_names(submessage)
+                logger.debug(f"IN {command} CLOSURE: {submessage=}")
+                channel_name = handler(submessage)
+                if command == IRC_END_OF_NAMES_MSG:
                     end_of_names_received = True
                     # TODO set a brief TTL for straggler join and chatter list messages.
             except Exception as e:  # pylint: disable=broad-exception-caught
@@ -323,33 +341,27 @@ class ViewerListFetcherChannelListener(Client):
                 )
                 logger.debug(f"{channel.chatters=}")
                 self._user_lists[channel_name].user_names.update(channel.chatters)
-        except (
-            HTTPException,
-            InvalidContent,
-            AuthenticationError,
-            IRCCooldownError,
-            TwitchIOException,
-            Unauthorized,
-        ) as e:
-            self._user_lists[channel_name].error = e
-            self._user_lists[channel_name].done = True
+        except TwitchIOException as e:
+            self._user_lists[channel_name].mark_done(error=e)
             raise VLFetcherChannelJoinError() from e
 
         logger.info(f"{self._name} joined {channel_name}")
 
     async def _wait_for_user_list(self, channel_name: str):
         logger.debug(f"Waiting for user list messages from {channel_name}")
-        while not self._user_lists[channel_name].done:
-            # These messages reportedly arrive in the order of whole seconds, so this may be too
-            # aggressive.
-            if (
-                self._user_lists[channel_name].calculate_time_elapsed()
-                >= OVERALL_TIMEOUT
-            ):
-                raise VLFetcherOvertimeError(
-                    f"Check for this channel exceeds {OVERALL_TIMEOUT}s."
-                )
-            await asyncio.sleep(0.1)
+        fetch_data = self._user_lists[channel_name]
+        if fetch_data.done:
+            return
+
+        # Wakes as soon as the 366 (or a join failure) marks this channel done, rather than
+        # polling; the remainder of the overall timeout bounds a dropped 366.
+        remaining = OVERALL_TIMEOUT - fetch_data.calculate_time_elapsed()
+        try:
+            await asyncio.wait_for(fetch_data.done_event.wait(), timeout=remaining)
+        except asyncio.TimeoutError as e:
+            raise VLFetcherOvertimeError(
+                f"Check for this channel exceeds {OVERALL_TIMEOUT}s."
+            ) from e
 
     async def _process_channel_task(self, channel_name: str):
         await self._join_channel(channel_name)
@@ -357,10 +369,7 @@ class ViewerListFetcherChannelListener(Client):
             await self._wait_for_user_list(channel_name)
         except VLFetcherOvertimeError as e:
             logger.error(f"Timeout exceeded for {channel_name}, parting.")
-            self._user_lists[channel_name].end_time = perf_counter()
-            self._user_lists[channel_name].calculate_final_time_elapsed()
-            self._user_lists[channel_name].done = True
-            self._user_lists[channel_name].error = e
+            self._user_lists[channel_name].mark_done(error=e)
 
     async def _kick_off_listener_tasks(self, channels: list[str]):
         tasks = []
@@ -381,38 +390,36 @@ class ViewerListFetcherChannelListener(Client):
 
         Returns:
             Tuple[dict[str, ViewerListFetchData], float]:
-                - A dict mapping channel_name to ViewerListFetchData
+                - A dict mapping channel_name to ViewerListFetchData. The caller owns it; the
+                  listener doesn't keep a reference.
                 - The total time this call took to join, fetch, and part from all given channels, in
                   seconds.
         """
-        if not all(isinstance(c, str) for c in channels):
-            raise TypeError("channels list contains non-str type(s).")
-
         logger.debug(f"Targeted {channels=}")
 
-        self._user_lists: dict[str, ViewerListFetchData] = {
-            channel.lower(): ViewerListFetchData() for channel in channels
-        }
+        # Lowercase once here and hand the same keys to the listener tasks, so a mixed-case name
+        # can't end up joined under one key and looked up under another. Dupes collapse too.
+        user_lists: dict[str, ViewerListFetchData] = {}
+        for channel in channels:
+            if not isinstance(channel, str):
+                raise TypeError("channels list contains non-str type(s).")
+            user_lists[channel.lower()] = ViewerListFetchData()
+        self._user_lists = user_lists
         start_time: float = perf_counter()
 
         logger.debug(f"Prepped: {self._user_lists=}")
 
         try:
             logger.debug("Kicking off listener tasks.")
-            await self._kick_off_listener_tasks(channels)
-        except (
-            HTTPException,
-            InvalidContent,
-            AuthenticationError,
-            IRCCooldownError,
-            TwitchIOException,
-            Unauthorized,
-        ) as e:
+            await self._kick_off_listener_tasks(list(self._user_lists))
+        except TwitchIOException as e:
             logger.error(f"Error fetching viewer list for channels: {e}")
             raise e
 
         total_time_elapsed = perf_counter() - start_time
-        return self._user_lists.copy(), total_time_elapsed
+        # Hand the dict over rather than copying it; the next call builds a fresh one anyway.
+        self._user_lists = {}
+        return user_lists, total_time_elapsed
 
 
 # Sample usage follows
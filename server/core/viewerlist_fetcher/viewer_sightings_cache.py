@@ -137,14 +137,17 @@ class ViewerSightingsCache:
             return None
 
         data_dict = {data[i]: data[i + 1] for i in range(0, len(data), 2)}
+        timestamp = data_dict.get("timestamp")
 
         return CachedViewerSighting(
             username=username,
             times_seen=int(data_dict.get("times_seen", 0)),
             enriched=json.loads(data_dict.get("enriched", "false")),
             aggregated=json.loads(data_dict.get("aggregated", "false")),
-            timestamp=datetime.fromisoformat(
-                data_dict.get("timestamp", datetime.now(timezone.utc).isoformat())
+            timestamp=(
+                datetime.fromisoformat(timestamp)
+                if timestamp is not None
+                else datetime.now(timezone.utc)
             ),
         )
 
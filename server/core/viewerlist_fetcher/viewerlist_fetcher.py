@@ -25,8 +25,10 @@
     
     Configurable hard limits on quantity of chat-joins per window. Docs say it's 20 joins per 10s.
     We could play very safely and cap at 18 joins per 10s OR 20 joins per 10.2s, etc.
+
+    Each JOIN takes a token from a TokenBucket sized JOINS_PER_WINDOW that refills over
+    JOIN_WINDOW_SECONDS, so we only wait when the budget is actually spent.
 """
-import asyncio
 import logging
 
 from server.models import (
@@ -37,6 +39,7 @@ from server.models import (
 from server.utils import (
     RedisSharedQueue,
     RedisSharedQueueDetails,
+    TokenBucket,
     get_redis_shared_queue,
 )
 
@@ -44,6 +47,9 @@ from .channel_listener import ViewerListFetcherChannelListener
 
 logger = logging.getLogger("__name__")
 
+JOINS_PER_WINDOW = 20
+JOIN_WINDOW_SECONDS = 10.0
+
 
 class ViewerListFetcher:
     def __init__(
@@ -59,6 +65,10 @@ class ViewerListFetcher:
         self._listener: ViewerListFetcherChannelListener = (
             ViewerListFetcherChannelListener(worker_id, access_token)
         )
+        self._join_rate_limit = TokenBucket(
+            capacity=JOINS_PER_WINDOW,
+            refill_per_second=JOINS_PER_WINDOW / JOIN_WINDOW_SECONDS,
+        )
         self._working = True
         self._idle = False
 
@@ -86,6 +96,7 @@ class ViewerListFetcher:
                 logger.info("Nothing on workbench.")
             else:
                 logger.debug(f"Grabbed {target_channel} from workbench.")
+                await self._join_rate_limit.acquire(1)
                 await self._listener.connect()
                 fetch_data, time_elapsed = (
                     await self._listener.fetch_viewer_list_for_channels(
@@ -97,6 +108,4 @@ class ViewerListFetcher:
                     f"{self._worker_id} FETCHED {len(user_names)}: {user_names}"
                 )
                 logger.info(f"{time_elapsed=}")
-                logger.info("Sleeping to appease the rate limit.")
-                await asyncio.sleep(10.0)
         await self._listener.close()
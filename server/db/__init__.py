@@ -1,4 +1,16 @@
-from .db import async_create_all_tables, get_db
-from .db_tools import upsert_one
+from .db import (
+    DatabaseConnectionError,
+    async_create_all_tables,
+    async_dispose_engine,
+    get_db,
+)
+from .db_tools import insert_many, upsert_one
 
-__all__ = ["async_create_all_tables", "get_db", "upsert_one"]
+__all__ = [
+    "DatabaseConnectionError",
+    "async_create_all_tables",
+    "async_dispose_engine",
+    "get_db",
+    "insert_many",
+    "upsert_one",
+]
@@ -0,0 +1,21 @@
+# server/db/__main__.py
+"""
+    One-shot schema creation: `python -m server.db`
+
+    Creates any missing tables and exits, so it can run once at container start ahead of the
+    server rather than inside every worker's startup.
+"""
+import asyncio
+
+from .db import async_create_all_tables, async_dispose_engine
+
+
+async def _init_schema() -> None:
+    try:
+        await async_create_all_tables()
+    finally:
+        await async_dispose_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(_init_schema())
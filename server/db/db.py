@@ -1,23 +1,94 @@
+import asyncio
+import logging
+import random
+from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import Connection, inspect
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
 from server.config import Config
 
+logger = logging.getLogger(__name__)
+
+_MAX_RETRY_DELAY = 30.0
+
+
+class DatabaseConnectionError(Exception):
+    pass
+
+
 # Creating async engine
 async_engine = create_async_engine(
-    Config.get_db_uri(), echo=True, future=True, hide_parameters=True
+    Config.get_db_uri(),
+    echo=True,
+    future=True,
+    hide_parameters=True,
+    pool_size=Config.DB_POOL_SIZE,
+    max_overflow=Config.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=Config.DB_POOL_RECYCLE_SECONDS,
+    pool_timeout=Config.DB_POOL_TIMEOUT_SECONDS,
+    connect_args={"connect_timeout": Config.DB_CONNECT_TIMEOUT_SECONDS},
+    insertmanyvalues_page_size=Config.DB_INSERT_PAGE_SIZE,
 )
 
+# One session factory bound to the one engine; every session in the app comes from here.
+async_session_factory = async_sessionmaker(async_engine)
+
 
 @asynccontextmanager
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSession(async_engine) as async_session:
+    async with async_session_factory() as async_session:
         yield async_session
 
 
+def _create_missing_tables(conn: Connection) -> None:
+    """Reflect the existing table names once and create only what's missing.
+
+    create_all(checkfirst=True) probes each table individually; this is one round trip on a DB
+    that's already set up.
+    """
+    existing = set(inspect(conn).get_table_names())
+    missing = [
+        table
+        for name, table in SQLModel.metadata.tables.items()
+        if name not in existing
+    ]
+    if not missing:
+        return
+
+    logger.info(f"Creating tables: {[table.name for table in missing]}")
+    SQLModel.metadata.create_all(conn, tables=missing, checkfirst=False)
+
+
 async def async_create_all_tables():
-    async with async_engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+    # The DB container may still be coming up when we do; back off and retry a bounded number of
+    # times rather than failing the boot outright.
+    max_retries = Config.DB_CONNECT_MAX_RETRIES
+    for attempt in range(max_retries):
+        try:
+            async with async_engine.begin() as conn:
+                await conn.run_sync(_create_missing_tables)
+            return
+        except OperationalError as e:
+            if attempt == max_retries - 1:
+                raise DatabaseConnectionError(
+                    f"Couldn't reach the DB after {max_retries} attempts."
+                ) from e
+            delay = (
+                min(Config.DB_CONNECT_RETRY_INTERVAL * 2**attempt, _MAX_RETRY_DELAY)
+                + random.random()
+            )
+            logger.warning(
+                f"DB connect attempt {attempt + 1}/{max_retries} failed, "
+                f"retrying in {delay:.1f}s: {e.orig}"
+            )
+            await asyncio.sleep(delay)
+
+
+async def async_dispose_engine():
+    """Close out the connection pool; call once at shutdown."""
+    await async_engine.dispose()
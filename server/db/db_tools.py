@@ -1,5 +1,7 @@
-from typing import Optional
+import functools
+from typing import Any, Optional
 
+from sqlalchemy import Select, bindparam, insert
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import SQLModel, inspect, select
@@ -15,18 +17,75 @@ async def upsert_one(db_model: SQLModel, session: Optional[AsyncSession] = None)
         await _upsert(db_model, session)
 
 
+INSERT_MANY_BATCH_SIZE = 10_000
+
+
+async def insert_many(
+    model_class: type[SQLModel],
+    rows: list[dict[str, Any]],
+    session: Optional[AsyncSession] = None,
+    batch_size: int = INSERT_MANY_BATCH_SIZE,
+):
+    """Insert rows (column name -> value dicts) into model_class's table with Core executemany,
+    skipping the ORM unit of work. SQLAlchemy batches these into multi-row INSERT ... VALUES.
+
+    Rows are written batch_size at a time. Without a session, insert_many opens its own and commits
+    after each batch, so a huge insert doesn't sit in one transaction; if a later batch fails, the
+    earlier ones stay committed. With a session, each batch is only flushed and the commit (or
+    rollback) is left to the caller, so a multi-batch insert can be part of one transaction.
+
+    NOTE. The rows aren't validated by the model; that's on the caller.
+    """
+    if not rows:
+        return
+    if session is None:
+        async with get_db() as session:
+            await _insert_many(
+                model_class, rows, session, batch_size, owns_session=True
+            )
+    else:
+        await _insert_many(model_class, rows, session, batch_size, owns_session=False)
+
+
+async def _insert_many(
+    model_class: type[SQLModel],
+    rows: list[dict[str, Any]],
+    session: AsyncSession,
+    batch_size: int,
+    owns_session: bool,
+):
+    statement = insert(model_class.__table__)
+    for start in range(0, len(rows), batch_size):
+        await session.execute(statement, rows[start : start + batch_size])
+        if owns_session:
+            await session.commit()
+        else:
+            await session.flush()
+
+
+@functools.lru_cache(maxsize=None)
+def _select_by_primary_key(model_class: type[SQLModel]) -> tuple[str, Select]:
+    """Build (once per model) the primary key name and a SELECT-by-primary-key statement.
+
+    The statement takes its value via the "primary_key_value" bind parameter, so the same statement
+    object (and so SQLAlchemy's cached compilation of it) gets reused on every call.
+    """
+    mapper = inspect(model_class)
+    primary_key_column = mapper.primary_key[0].name
+    statement = select(model_class).where(
+        getattr(model_class, primary_key_column) == bindparam("primary_key_value")
+    )
+    return primary_key_column, statement
+
+
 async def _upsert(db_model: SQLModel, session: AsyncSession):
     # Determine what the primary key-value pair is for this item.
     model_class = db_model.__class__
-    mapper = inspect(model_class)
-    primary_key_column = mapper.primary_key[0].name
+    primary_key_column, statement = _select_by_primary_key(model_class)
     primary_key_value = getattr(db_model, primary_key_column)
 
     # Check if the item already exists based on the primary key
-    statement = select(model_class).where(
-        getattr(model_class, primary_key_column) == primary_key_value
-    )
-    result = await session.execute(statement)
+    result = await session.execute(statement, {"primary_key_value": primary_key_value})
     existing_item = result.scalar_one_or_none()
 
     if existing_item:
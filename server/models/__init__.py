@@ -54,6 +54,7 @@ from .sqlmodel.suspected_bot import (
     SuspectedBotRead,
     SuspicionLevel,
     SuspicionReason,
+    classify_suspicion_level,
 )
 from .sqlmodel.twitch_user_data import (
     TwitchAccountType,
@@ -90,6 +91,7 @@ __all__ = [
     "SUSPICION_RANKING_THRESHOLDS",
     "SuspicionLevel",
     "SuspicionReason",
+    "classify_suspicion_level",
     "TwitchAccountType",
     "TwitchBroadcasterType",
     "TwitchUserData",
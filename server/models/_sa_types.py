@@ -0,0 +1,101 @@
+# server/models/_sa_types.py
+"""
+    Custom SQLAlchemy column types shared across the table models.
+
+    UUIDBinary - Stores a UUID as BINARY(16) rather than SQLModel's default CHAR(32) hex string; half
+    the bytes in the row and in every index (including the PK that InnoDB clusters on), and key
+    compares are a 16-byte memcmp. Binds a UUID, its str form, or its 16 raw bytes. Reads come back
+    as uuid.UUID, so the models don't notice.
+
+    SecondsAsMicros - Stores a duration in seconds (float, from time.perf_counter() deltas) as a
+    BIGINT count of microseconds; no FLOAT precision loss, and AVG()/SUM() run on integers. Reads
+    come back as float seconds. To aggregate in SQL, divide by 1_000_000 yourself.
+
+    EpochMicros - Stores a datetime as a BIGINT count of microseconds since the Unix epoch (UTC), so
+    range filters are integer compares and reads skip the driver's DATETIME parsing. Naive datetimes
+    are taken to be UTC; reads come back as timezone-aware UTC datetimes. In raw SQL,
+    FROM_UNIXTIME(col / 1000000) gets you something readable.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import BINARY, BigInteger
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class UUIDBinary(TypeDecorator):  # pylint: disable=too-many-ancestors
+    """UUID stored as BINARY(16)."""
+
+    impl = BINARY(16)
+    cache_ok = True
+
+    @property
+    def python_type(self) -> type:
+        return UUID
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        if isinstance(value, UUID):
+            return value.bytes
+        if isinstance(value, bytes) and len(value) == 16:
+            return value  # already raw; e.g. straight out of uuid_pool
+        return UUID(str(value)).bytes
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[UUID]:
+        if value is None:
+            return None
+        return UUID(bytes=value)
+
+
+_MICROS_PER_SECOND = 1_000_000
+
+
+class SecondsAsMicros(TypeDecorator):  # pylint: disable=too-many-ancestors
+    """Duration in seconds stored as integer microseconds in a BIGINT."""
+
+    impl = BigInteger
+    cache_ok = True
+
+    @property
+    def python_type(self) -> type:
+        return float
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return round(value * _MICROS_PER_SECOND)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[float]:
+        if value is None:
+            return None
+        return value / _MICROS_PER_SECOND
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+class EpochMicros(TypeDecorator):  # pylint: disable=too-many-ancestors
+    """UTC datetime stored as integer microseconds since the Unix epoch in a BIGINT."""
+
+    impl = BigInteger
+    cache_ok = True
+
+    @property
+    def python_type(self) -> type:
+        return datetime
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> Optional[int]:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return (value - _EPOCH) // _ONE_MICROSECOND
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Optional[datetime]:
+        if value is None:
+            return None
+        return _EPOCH + timedelta(microseconds=value)
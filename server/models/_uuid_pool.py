@@ -0,0 +1,86 @@
+# server/models/_uuid_pool.py
+"""
+    uuid7_from_pool
+
+    Time-ordered (version 7, RFC 9562) UUIDs for the primary keys. They lead with a millisecond
+    Unix timestamp, so new keys land at the right-hand end of the B-tree instead of splitting pages
+    all over it. Within the same millisecond the random tail is bumped by one per UUID, so they keep
+    sorting in creation order, bytewise too (they live in BINARY(16) columns).
+
+    The random tails are sliced off a 16 KiB buffer of os.urandom bytes rather than costing a
+    syscall per UUID.
+
+    The buffer and the ordering state are guarded by a lock (sync code can run in the threadpool)
+    and dropped in forked children so two worker processes never hand out the same UUIDs.
+"""
+import os
+import threading
+import time
+from uuid import UUID
+
+_UUIDS_PER_REFILL = 1024
+_UUID_BYTES = 16
+
+# uuid7 layout: 48 bits of ms timestamp | 4 bits version | 12 bits rand_a | 2 bits variant |
+# 62 bits rand_b. The two random fields are treated as one 74-bit counter.
+_UUID7_TAIL_BITS = 74
+_UUID7_RAND_B_BITS = 62
+_UUID7_RAND_B_MASK = (1 << _UUID7_RAND_B_BITS) - 1
+# Fresh tails start with the top bit clear, leaving 2**73 increments of headroom per millisecond.
+_UUID7_SEED_MASK = (1 << (_UUID7_TAIL_BITS - 1)) - 1
+_UUID7_VERSION_AND_VARIANT = (0x7 << 76) | (0b10 << 62)
+
+_lock = threading.Lock()
+_buffer = b""
+_offset = 0
+_uuid7_last_ms = 0
+_uuid7_last_tail = 0
+
+
+def _reset_pool() -> None:
+    global _buffer, _offset, _uuid7_last_ms, _uuid7_last_tail  # pylint: disable=global-statement
+    _buffer = b""
+    _offset = 0
+    _uuid7_last_ms = 0
+    _uuid7_last_tail = 0
+
+
+def _take_random_bytes(count: int) -> bytes:
+    """Slice count bytes off the buffer, refilling it if needed. Call with _lock held."""
+    global _buffer, _offset  # pylint: disable=global-statement
+    if _offset + count > len(_buffer):
+        _buffer = os.urandom(_UUID_BYTES * _UUIDS_PER_REFILL)
+        _offset = 0
+    raw = _buffer[_offset : _offset + count]
+    _offset += count
+    return raw
+
+
+def uuid7_from_pool() -> UUID:
+    """Return a time-ordered (version 7) UUID."""
+    global _uuid7_last_ms, _uuid7_last_tail  # pylint: disable=global-statement
+    now_ms = time.time_ns() // 1_000_000
+    with _lock:
+        if now_ms > _uuid7_last_ms:
+            tail = int.from_bytes(_take_random_bytes(10)) & _UUID7_SEED_MASK
+        else:
+            # Same millisecond (or the clock stepped back): keep counting up from the last one.
+            now_ms = _uuid7_last_ms
+            tail = _uuid7_last_tail + 1
+
+        if tail >> _UUID7_TAIL_BITS:
+            now_ms += 1
+            tail = 0
+
+        _uuid7_last_ms = now_ms
+        _uuid7_last_tail = tail
+
+    return UUID(
+        int=(now_ms << 80)
+        | _UUID7_VERSION_AND_VARIANT
+        | ((tail >> _UUID7_RAND_B_BITS) << 64)
+        | (tail & _UUID7_RAND_B_MASK)
+    )
+
+
+os.register_at_fork(after_in_child=_reset_pool)
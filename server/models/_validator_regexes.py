@@ -1,7 +1,9 @@
 # server/models/_validator_regexes.py
 # A centralized spot for regexes used in data validation for Twitch API responses.
+#
+# The *_REGEX strings are what pydantic's StringConstraints(pattern=...) wants; IN_APP_NOTES_RE is
+# the same thing compiled once at import, for SuspectedBotBase's hand-written validator.
 import re
-from typing import Any
 
 APP_UUID4_REGEX = (
     r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
@@ -11,9 +13,4 @@ LANGUAGE_CODE_REGEX = r"^[a-z]{2}$"
 TWITCH_LOGIN_NAME_REGEX = r"^[a-z0-9_]{1,25}$"
 TWITCH_TOKEN_REGEX = r"^[a-zA-Z0-9]+$"
 
-
-def matches_regex(value: Any, pattern: str) -> str:
-    """Check if the given value matches the provided regex pattern."""
-    if not isinstance(value, str) or not bool(re.match(pattern, value)):
-        raise ValueError
-    return value
+IN_APP_NOTES_RE = re.compile(IN_APP_NOTES_REGEX)
@@ -16,11 +16,19 @@ Classes:
 """
 from datetime import datetime
 from enum import StrEnum
-from typing import Annotated, Any, Optional
-from uuid import UUID, uuid4
+from typing import TYPE_CHECKING, Annotated, Any, Optional, cast
+from uuid import UUID
 
 from pydantic import model_validator
-from sqlmodel import Field, SQLModel
+from sqlalchemy import Enum as SAEnum
+from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel._compat import SQLModelConfig
+
+from .._sa_types import SecondsAsMicros, UUIDBinary
+from .._uuid_pool import uuid7_from_pool
+
+if TYPE_CHECKING:
+    from .stream_viewerlist_fetch import StreamViewerListFetch
 
 
 class ScanningSessionStopReasonEnum(StrEnum):
@@ -30,6 +38,17 @@ class ScanningSessionStopReasonEnum(StrEnum):
     ERRORED = "errored"  # A recoverable but scan-killing error occurred.
 
 
+_STOP_REASON_VALUES = frozenset(
+    member.value for member in ScanningSessionStopReasonEnum
+)
+_STOP_REASON_SA_ENUM = SAEnum(
+    ScanningSessionStopReasonEnum,
+    name="scanning_session_stop_reason",
+    values_callable=lambda enum_class: [member.value for member in enum_class],
+    validate_strings=True,
+)
+
+
 class ScanningSessionBase(SQLModel):
     """This table stores metrics for independent scanning session.
 
@@ -64,21 +83,36 @@ class ScanningSessionBase(SQLModel):
 
     time_started: datetime = Field(...)
     time_ended: Optional[datetime] = Field(None)
+    # Stored as a native MySQL ENUM (1 byte) rather than a VARCHAR; the Python side stays str.
+    # The column default lives in the DDL, so Core inserts that leave it out cost nothing per row.
     reason_ended: Annotated[
-        Optional[str], Field(default=ScanningSessionStopReasonEnum.UNSPECIFIED)
+        Optional[str],
+        Field(
+            default=ScanningSessionStopReasonEnum.UNSPECIFIED,
+            sa_type=_STOP_REASON_SA_ENUM,
+            sa_column_kwargs={
+                "default": None,
+                "server_default": ScanningSessionStopReasonEnum.UNSPECIFIED.value,
+            },
+        ),
     ]
     streams_in_scan: Annotated[int, Field(..., gt=0)]  # total number of targets
     viewerlists_fetched: Annotated[
         Optional[int], Field(default=None, ge=0)
     ]  # total fetched so far
-    average_time_per_fetch: Annotated[Optional[float], Field(default=None, ge=0.0)]
+    # Timings are stored as BIGINT microseconds; they're still float seconds on the Python side.
+    average_time_per_fetch: Annotated[
+        Optional[float], Field(default=None, ge=0.0, sa_type=SecondsAsMicros)
+    ]
     average_time_for_get_user_call: Annotated[
-        Optional[float], Field(default=None, ge=0.0)
+        Optional[float], Field(default=None, ge=0.0, sa_type=SecondsAsMicros)
     ]
     average_time_for_get_stream_call: Annotated[
-        Optional[float], Field(default=None, ge=0.0)
+        Optional[float], Field(default=None, ge=0.0, sa_type=SecondsAsMicros)
+    ]
+    average_worker_idle_time: Annotated[
+        Optional[float], Field(default=None, ge=0.0, sa_type=SecondsAsMicros)
     ]
-    average_worker_idle_time: Annotated[Optional[float], Field(default=None, ge=0.0)]
 
     # eventually will have an in-mem cache of known suspects that we may want to showcase in
     # active monitoring, so here's a counter
@@ -89,7 +123,15 @@ class ScanningSessionBase(SQLModel):
 class ScanningSession(ScanningSessionBase, table=True):
     __tablename__: str = "scanning_sessions"
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(
+        default_factory=uuid7_from_pool, primary_key=True, sa_type=UUIDBinary
+    )
+
+    # Almost always wanted alongside the session (fetch counts, timings), and lazy loading isn't an
+    # option under asyncio anyway, so pull them in with one SELECT ... IN per batch of sessions.
+    stream_viewerlist_fetches: list["StreamViewerListFetch"] = Relationship(
+        back_populates="scanning_session", sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
 
 class ScanningSessionCreate(ScanningSessionBase):
@@ -97,11 +139,7 @@ class ScanningSessionCreate(ScanningSessionBase):
 
     @model_validator(mode="before")
     def check_enum(cls, data: dict[str, Any]) -> dict[str, Any]:
-        if (
-            "reason_ended" in data
-            and data["reason_ended"]
-            not in ScanningSessionStopReasonEnum.__members__.values()
-        ):
+        if "reason_ended" in data and data["reason_ended"] not in _STOP_REASON_VALUES:
             raise ValueError(
                 f"{data['reason_ended']} is not a member of ScanningSessionStopReasonEnum"
             )
@@ -111,4 +149,6 @@ class ScanningSessionCreate(ScanningSessionBase):
 class ScanningSessionRead(ScanningSessionBase):
     """Pydantic model for returning ScanningSession data."""
 
+    model_config = cast(SQLModelConfig, {"frozen": True})
+
     scanning_session_id: UUID
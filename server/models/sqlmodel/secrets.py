@@ -21,10 +21,12 @@ Classes:
 """
 from datetime import datetime
 from enum import StrEnum
-from typing import Annotated, Any, Optional
+from typing import Annotated, Any, Optional, cast
 
 from pydantic import StringConstraints, model_validator
+from sqlalchemy import text
 from sqlmodel import Field, SQLModel
+from sqlmodel._compat import SQLModelConfig
 
 from .._validator_regexes import TWITCH_TOKEN_REGEX
 
@@ -33,6 +35,9 @@ class TokenType(StrEnum):
     BEARER = "bearer"
 
 
+_TOKEN_TYPE_VALUES = frozenset(member.value for member in TokenType)
+
+
 class SecretBase(SQLModel):
     access_token: Annotated[
         str, StringConstraints(max_length=512, pattern=TWITCH_TOKEN_REGEX), Field(...)
@@ -45,7 +50,11 @@ class SecretBase(SQLModel):
     scope: Annotated[
         str, StringConstraints(min_length=7), Field(...)
     ]  # space-delimited
-    last_update_timestamp: Optional[datetime] = Field(default=None, nullable=False)
+    last_update_timestamp: Optional[datetime] = Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": text("CURRENT_TIMESTAMP")},
+    )
 
 
 class Secret(SecretBase, table=True):
@@ -69,7 +78,12 @@ class Secret(SecretBase, table=True):
     __tablename__: str = "secrets"
 
     id: int = Field(default_factory=int, primary_key=True)
-    enforce_one_row: str = Field(default="enforce_one_row", unique=True, nullable=False)
+    enforce_one_row: str = Field(
+        default="enforce_one_row",
+        unique=True,
+        nullable=False,
+        sa_column_kwargs={"default": None, "server_default": "enforce_one_row"},
+    )
 
 
 class SecretCreate(SecretBase):
@@ -81,7 +95,7 @@ class SecretCreate(SecretBase):
         if data["scope"] is None:
             raise ValueError("Scope missing.")
 
-        if data["token_type"] not in TokenType.__members__.values():
+        if data["token_type"] not in _TOKEN_TYPE_VALUES:
             raise ValueError("Unknown token type.")
 
         if isinstance(data["scope"], list):
@@ -92,4 +106,6 @@ class SecretCreate(SecretBase):
 
 
 class SecretRead(SecretBase):
+    model_config = cast(SQLModelConfig, {"frozen": True})
+
     id: int
@@ -14,7 +14,7 @@ Classes:
 """
 from typing import Annotated, Any, cast
 
-from pydantic import StringConstraints, model_validator
+from pydantic import model_validator
 from sqlmodel import Field, SQLModel
 from sqlmodel._compat import SQLModelConfig
 
@@ -31,8 +31,7 @@ class StreamCategoryBase(SQLModel):
     ]  #  alias="game_id",
     category_name: Annotated[
         str,
-        StringConstraints(max_length=40),
-        Field(default=NO_CATEGORY_NAME, index=True),
+        Field(default=NO_CATEGORY_NAME, index=True, max_length=40),
     ]  # alias="game_name",
 
     @model_validator(mode="before")
@@ -45,13 +44,9 @@ class StreamCategoryBase(SQLModel):
             data["category_name"] = data.pop("name")
         return data
 
-    model_config = cast(
-        SQLModelConfig,
-        {
-            "populate_by_name": "True",
-            "arbitrary_types_allowed": "True",
-        },
-    )
+    # extra is left at the default ("ignore"): the rest of the Twitch payload (box_art_url, etc.) is
+    # dropped rather than kept on every instance.
+    model_config = cast(SQLModelConfig, {"populate_by_name": True})
 
 
 class StreamCategory(StreamCategoryBase, table=True):
@@ -59,7 +54,7 @@ class StreamCategory(StreamCategoryBase, table=True):
 
     Args:
         category_id (int): Twitch's UID for this category.
-        category_name (str): The US English (EN) localization of this category's name, limited to 25
+        category_name (str): The US English (EN) localization of this category's name, limited to 40
             characters.
 
     Relationships:
@@ -75,3 +70,5 @@ class StreamCategoryCreate(StreamCategoryBase):
 
 class StreamCategoryRead(StreamCategoryBase):
     """Pydantic model to read a db row for this category."""
+
+    model_config = cast(SQLModelConfig, {"frozen": True})
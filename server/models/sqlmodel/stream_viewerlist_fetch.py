@@ -52,15 +52,27 @@ SQLModel constructs:
 """
 from datetime import datetime
 from enum import StrEnum
-from typing import Annotated, Any, Optional, cast
-from uuid import UUID, uuid4
+from typing import TYPE_CHECKING, Annotated, Any, Optional, cast
+from uuid import UUID
 
 from pydantic import StringConstraints, model_validator
-from sqlmodel import Field, SQLModel
+from sqlalchemy import CHAR, BigInteger
+from sqlalchemy import Enum as SAEnum
+from sqlalchemy import Index
+from sqlalchemy.dialects import mysql
+from sqlmodel import Field, Relationship, SQLModel
 from sqlmodel._compat import SQLModelConfig
 
+from .._sa_types import EpochMicros, SecondsAsMicros, UUIDBinary
+from .._uuid_pool import uuid7_from_pool
 from .._validator_regexes import LANGUAGE_CODE_REGEX
 
+if TYPE_CHECKING:
+    from .scanning_session import ScanningSession
+    from .stream_categories import StreamCategory
+    from .twitch_user_data import TwitchUserData
+    from .viewer_sighting import ViewerSighting
+
 
 class StreamViewerListFetchStatus(StrEnum):
     # it's on the list to be scanned (and it has an entry in the StreamViewerListFetch table)
@@ -73,16 +85,26 @@ class StreamViewerListFetchStatus(StrEnum):
     COMPLETE = "complete"
 
 
+_FETCH_STATUS_VALUES = frozenset(member.value for member in StreamViewerListFetchStatus)
+_LANGUAGE_CODE_SA_TYPE = CHAR(2).with_variant(mysql.CHAR(2, charset="ascii"), "mysql")
+_FETCH_STATUS_SA_ENUM = SAEnum(
+    StreamViewerListFetchStatus,
+    name="stream_viewerlist_fetch_status",
+    values_callable=lambda enum_class: [member.value for member in enum_class],
+    validate_strings=True,
+)
+
+
 class GetStreamResponse(SQLModel):
     """See StreamViewerListFetchBase docstring below."""
 
     channel_owner_id: Annotated[
         int,
         Field(
-            index=True,
             ge=0,
             foreign_key="twitch_user_data.twitch_account_id",
             nullable=False,
+            sa_type=BigInteger,
         ),
     ]
     category_id: Annotated[
@@ -95,9 +117,14 @@ class GetStreamResponse(SQLModel):
         ),
     ]
     viewer_count: Annotated[int, Field(..., ge=0)]
-    stream_id: Annotated[int, Field(..., ge=0)]
-    stream_started_at: datetime = Field(...)
-    language: Annotated[str, StringConstraints(pattern=LANGUAGE_CODE_REGEX)]
+    stream_id: Annotated[int, Field(..., ge=0, sa_type=BigInteger)]
+    stream_started_at: datetime = Field(..., sa_type=EpochMicros)
+    # Always two ASCII letters: a fixed 2-byte column rather than utf8mb4's 4 bytes per char.
+    language: Annotated[
+        str,
+        StringConstraints(pattern=LANGUAGE_CODE_REGEX),
+        Field(sa_type=_LANGUAGE_CODE_SA_TYPE),
+    ]
     is_mature: bool = Field(...)
     was_live: bool = Field(...)
 
@@ -169,31 +196,32 @@ class StreamViewerListFetchBase(GetStreamResponse):
         viewer_sightings (): many viewer_sightings to one stream_viewerlist_fetch
     """
 
-    fetch_action_at: datetime = Field(..., nullable=False)
+    fetch_action_at: datetime = Field(..., nullable=False, sa_type=EpochMicros)
     duration_of_fetch_action: Annotated[
-        Optional[float], Field(default=None, nullable=True, ge=0.0)
+        Optional[float],
+        Field(default=None, nullable=True, ge=0.0, sa_type=SecondsAsMicros),
     ]
-    fetch_status: str = Field(default=StreamViewerListFetchStatus.PENDING)
+    # Stored as a native MySQL ENUM (1 byte) rather than a VARCHAR; the Python side stays str.
+    fetch_status: str = Field(
+        default=StreamViewerListFetchStatus.PENDING,
+        sa_type=_FETCH_STATUS_SA_ENUM,
+        sa_column_kwargs={
+            "default": None,
+            "server_default": StreamViewerListFetchStatus.PENDING.value,
+        },
+    )
 
     scanning_session_id: UUID = Field(
-        foreign_key="scanning_sessions.id", nullable=False, index=True
+        foreign_key="scanning_sessions.id",
+        nullable=False,
+        sa_type=UUIDBinary,
     )
 
-    model_config = cast(
-        SQLModelConfig,
-        {
-            "populate_by_name": "True",
-            "arbitrary_types_allowed": "True",
-        },
-    )
+    model_config = cast(SQLModelConfig, {"populate_by_name": True})
 
     @model_validator(mode="before")
     def check_fields(cls, data: dict[str, Any]) -> dict[str, Any]:
-        if (
-            "fetch_status" in data
-            and not data["fetch_status"]
-            in StreamViewerListFetchStatus.__members__.values()
-        ):
+        if "fetch_status" in data and not data["fetch_status"] in _FETCH_STATUS_VALUES:
             raise ValueError("Invalid value for StreamViewerListFetchStatus enum.")
 
         return data
@@ -202,8 +230,54 @@ class StreamViewerListFetchBase(GetStreamResponse):
 class StreamViewerListFetch(StreamViewerListFetchBase, table=True):
 
     __tablename__: str = "stream_viewerlist_fetch"
+    # "Fetches of channel X over time range T" is a range scan on the first; scan-progress counts
+    # ("pending fetches in this scan, by category") are answered from the second without touching
+    # the rows. Each also serves as the index for the FK it leads with.
+    # Nothing in this table is free text (ids, numbers, timestamps, ENUMs, ISO codes), so the table
+    # defaults to ascii rather than utf8mb4.
+    __table_args__ = (
+        Index(
+            "ix_svf_channel_owner_id_fetch_action_at",
+            "channel_owner_id",
+            "fetch_action_at",
+        ),
+        Index(
+            "ix_svf_session_status_category",
+            "scanning_session_id",
+            "fetch_status",
+            "category_id",
+        ),
+        {
+            "mysql_engine": "InnoDB",
+            "mysql_row_format": "DYNAMIC",
+            "mysql_charset": "ascii",
+        },
+    )
 
-    fetch_id: UUID = Field(default_factory=uuid4, primary_key=True)
+    fetch_id: UUID = Field(
+        default_factory=uuid7_from_pool, primary_key=True, sa_type=UUIDBinary
+    )
+
+    # The many-to-ones are loaded with one SELECT ... IN per batch of fetches rather than one query
+    # per fetch (and lazy loading isn't an option under asyncio anyway). Rows already in the
+    # identity map, e.g. the session when these came in through
+    # ScanningSession.stream_viewerlist_fetches, are used without any SQL.
+    scanning_session: Optional["ScanningSession"] = Relationship(
+        back_populates="stream_viewerlist_fetches",
+        sa_relationship_kwargs={"lazy": "selectin"},
+    )
+    stream_category: Optional["StreamCategory"] = Relationship(
+        sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    twitch_user_data: Optional["TwitchUserData"] = Relationship(
+        sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    # Potentially thousands per fetch, so touching this without having loaded it raises rather than
+    # quietly issuing a query per fetch. Use selectinload() on the queries that want them.
+    viewer_sightings: list["ViewerSighting"] = Relationship(
+        back_populates="stream_viewerlist_fetch",
+        sa_relationship_kwargs={"lazy": "raise_on_sql"},
+    )
 
 
 class StreamViewerListFetchCreate(StreamViewerListFetchBase):
@@ -213,5 +287,7 @@ class StreamViewerListFetchCreate(StreamViewerListFetchBase):
 class StreamViewerListFetchRead(StreamViewerListFetchBase):
     """Model for returning Stream Viewer List Fetch data."""
 
+    model_config = cast(SQLModelConfig, {"frozen": True})
+
     fetch_id: UUID
     scanning_session_id: UUID
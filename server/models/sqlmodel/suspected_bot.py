@@ -22,22 +22,25 @@ Classes:
     SuspicionLevel: Enum mapped to various levels of channel concurrency.
     SUSPICION_RANKING_THRESHOLDS: Helper dict mapping tuples of the threshold ranges to their
         respective SuspicionLevel.
+    classify_suspicion_level: Maps a concurrent channel count to its SuspicionLevel.
     SuspectedBots: SQLAlchemy table for tracking additional metadata and metrics for suspicious
         Twitch accounts.
     SuspectedBotAppData, Create, and Read: Pydantic BaseModels for validation and serializing.
 
 """
-import re
+from bisect import bisect_right
 from enum import Enum
-from typing import Annotated, Any, Optional, Tuple
-from uuid import UUID, uuid4
+from typing import Annotated, Any, Optional, Tuple, cast
+from uuid import UUID
 
 from pydantic import model_validator
+from sqlalchemy import BigInteger
 from sqlmodel import Field, SQLModel
+from sqlmodel._compat import SQLModelConfig
 
-from .._validator_regexes import IN_APP_NOTES_REGEX
-
-COMPILED_NOTES_REGEX = re.compile(IN_APP_NOTES_REGEX)
+from .._sa_types import UUIDBinary
+from .._uuid_pool import uuid7_from_pool
+from .._validator_regexes import IN_APP_NOTES_RE, IN_APP_NOTES_REGEX
 
 
 class SuspicionReason(str, Enum):
@@ -57,6 +60,10 @@ class SuspicionLevel(str, Enum):
     SAFE = "safe"  # special designation for bots that are known, e.g. SeryBot, Nightbot
 
 
+_SUSPICION_LEVEL_VALUES = frozenset(member.value for member in SuspicionLevel)
+_SUSPICION_REASON_VALUES = frozenset(member.value for member in SuspicionReason)
+
+
 SUSPICION_RANKING_THRESHOLDS: dict[Tuple[int, int], SuspicionLevel] = {
     (100001, 9999999): SuspicionLevel.RED,
     (50001, 100000): SuspicionLevel.ORANGE,
@@ -68,6 +75,25 @@ SUSPICION_RANKING_THRESHOLDS: dict[Tuple[int, int], SuspicionLevel] = {
     (1, 10): SuspicionLevel.NONE,
 }
 
+# SUSPICION_RANKING_THRESHOLDS flattened into sorted lower bounds for bisect. The ranges are
+# contiguous, so each level starts where the previous one ends.
+_SUSPICION_LEVEL_LOWER_BOUNDS, _SUSPICION_LEVELS_BY_BOUND = zip(
+    *sorted(
+        (low, level) for (low, _high), level in SUSPICION_RANKING_THRESHOLDS.items()
+    )
+)
+
+
+def classify_suspicion_level(channel_count: int) -> SuspicionLevel:
+    """Return the SuspicionLevel for an account seen in channel_count channels concurrently.
+
+    Anything past the top threshold is still RED; less than one channel is NONE.
+    """
+    index = bisect_right(_SUSPICION_LEVEL_LOWER_BOUNDS, channel_count) - 1
+    if index < 0:
+        return SuspicionLevel.NONE
+    return _SUSPICION_LEVELS_BY_BOUND[index]
+
 
 """Twitch Account IDs suspected of being a bot will be logged here. The definition of
 "suspicion" and associated thresholds will no doubt be modulated by data and experiments. This
@@ -130,6 +156,7 @@ class SuspectedBotBase(SQLModel):
         Field(
             foreign_key="twitch_user_data.twitch_account_id",
             nullable=False,
+            sa_type=BigInteger,
             unique=True,
             index=True,
         ),
@@ -153,11 +180,11 @@ class SuspectedBotBase(SQLModel):
     @classmethod
     def validate_fields(cls, data: dict[str, Any]) -> dict[str, Any]:
         """Ensure that the enum values provided are legit."""
-        if not data["suspicion_level"] in SuspicionLevel.__members__.values():
+        if not data["suspicion_level"] in _SUSPICION_LEVEL_VALUES:
             raise ValueError("Invalid value for suspicion_level enum.")
-        if not data["suspicion_reason"] in SuspicionReason.__members__.values():
+        if not data["suspicion_reason"] in _SUSPICION_REASON_VALUES:
             raise ValueError("Invalid value for suspicion_reason enum.")
-        if not COMPILED_NOTES_REGEX.match(data["additional_notes"]):
+        if not IN_APP_NOTES_RE.match(data["additional_notes"]):
             raise ValueError("additional_notes key failed regex check.")
         return data
 
@@ -166,7 +193,10 @@ class SuspectedBotBase(SQLModel):
 class SuspectedBot(SuspectedBotBase, table=True):
     __tablename__: str = "suspected_bots"
 
-    id: Annotated[UUID, Field(default_factory=uuid4, primary_key=True)]
+    id: Annotated[
+        UUID,
+        Field(default_factory=uuid7_from_pool, primary_key=True, sa_type=UUIDBinary),
+    ]
 
 
 # Create and Read Models
@@ -175,4 +205,4 @@ class SuspectedBotCreate(SuspectedBotBase):
 
 
 class SuspectedBotRead(SuspectedBotBase):
-    pass
+    model_config = cast(SQLModelConfig, {"frozen": True})
@@ -32,6 +32,7 @@ from enum import StrEnum
 from typing import Annotated, Any, Optional, cast
 
 from pydantic import BaseModel, StringConstraints, model_validator
+from sqlalchemy import BigInteger
 from sqlmodel import Field, SQLModel
 from sqlmodel._compat import SQLModelConfig
 
@@ -53,6 +54,10 @@ class TwitchBroadcasterType(StrEnum):
     NORMAL = ""
 
 
+_ACCOUNT_TYPE_VALUES = frozenset(member.value for member in TwitchAccountType)
+_BROADCASTER_TYPE_VALUES = frozenset(member.value for member in TwitchBroadcasterType)
+
+
 class TwitchUserDataBase(SQLModel, table=False):
     """SQLmodel representing Twitch Users that have been spotted during scans.
 
@@ -105,9 +110,14 @@ class TwitchUserDataBase(SQLModel, table=False):
         all_time_high_at (DateTime): Timestamp of the all_time_concurrent_channel_count reading.
     """
 
-    twitch_account_id: Annotated[int, Field(..., index=True, primary_key=True, ge=0)]
+    twitch_account_id: Annotated[
+        int,
+        Field(..., primary_key=True, ge=0, sa_type=BigInteger),
+    ]
     login_name: Annotated[
-        str, StringConstraints(pattern=TWITCH_LOGIN_NAME_REGEX), Field(..., index=True)
+        str,
+        StringConstraints(pattern=TWITCH_LOGIN_NAME_REGEX),
+        Field(..., index=True, max_length=25),
     ]
 
     # NOTE In the edgecase where we create a a partial row from 'Get Stream' data, these fields
@@ -169,23 +179,14 @@ class TwitchUserDataBase(SQLModel, table=False):
             if "viewer_count" in data:
                 data.pop("viewer_count")
 
-            if not data["account_type"] in TwitchAccountType.__members__.values():
+            if not data["account_type"] in _ACCOUNT_TYPE_VALUES:
                 raise ValueError("Invalid value for account_type enum.")
-            if (
-                not data["broadcaster_type"]
-                in TwitchBroadcasterType.__members__.values()
-            ):
+            if not data["broadcaster_type"] in _BROADCASTER_TYPE_VALUES:
                 raise ValueError("Invalid value for broadcaster_type enum.")
 
         return data
 
-    model_config = cast(
-        SQLModelConfig,
-        {
-            "populate_by_name": "True",
-            "arbitrary_types_allowed": "True",
-        },
-    )
+    model_config = cast(SQLModelConfig, {"populate_by_name": True})
 
 
 class TwitchUserData(TwitchUserDataBase, table=True):
@@ -201,6 +202,8 @@ class TwitchUserDataCreate(TwitchUserDataBase):
 class TwitchUserDataRead(TwitchUserDataBase):
     """Model for reading TwitchUserData from the db."""
 
+    model_config = cast(SQLModelConfig, {"frozen": True})
+
 
 class GetUsersResponse(BaseModel):
     """Model for parsing a 'Get Users' response which is a list[dict], where each dict will fall
@@ -1,22 +1,39 @@
 # server/models/viewer_sighting.py
 # SQLModel representing sightings of Twitch login names in a given channel.
-from typing import Annotated
-from uuid import UUID, uuid4
+from typing import TYPE_CHECKING, Annotated, Optional, cast
+from uuid import UUID
 
 from pydantic import StringConstraints
-from sqlmodel import Field, SQLModel
+from sqlalchemy import Index, false
+from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel._compat import SQLModelConfig
 
+from .._sa_types import UUIDBinary
+from .._uuid_pool import uuid7_from_pool
 from .._validator_regexes import TWITCH_LOGIN_NAME_REGEX
 
+if TYPE_CHECKING:
+    from .stream_viewerlist_fetch import StreamViewerListFetch
+
 
 class ViewerSightingBase(SQLModel, table=False):
     viewer_login_name: Annotated[
         str,
         StringConstraints(pattern=TWITCH_LOGIN_NAME_REGEX),
-        Field(..., index=True),
+        Field(..., max_length=25),
     ]
-    processed_by_user_data_enricher: bool = Field(default=False, nullable=False)
-    processed_by_user_sighting_aggregator: bool = Field(default=False, nullable=False)
+    # Defaults are applied by MySQL (server_default) rather than per row by SQLAlchemy, since
+    # bulk inserts into this table leave these out.
+    processed_by_user_data_enricher: bool = Field(
+        default=False,
+        nullable=False,
+        sa_column_kwargs={"default": None, "server_default": false()},
+    )
+    processed_by_user_sighting_aggregator: bool = Field(
+        default=False,
+        nullable=False,
+        sa_column_kwargs={"default": None, "server_default": false()},
+    )
 
 
 class ViewerSighting(ViewerSightingBase, table=True):
@@ -52,11 +69,28 @@ class ViewerSighting(ViewerSightingBase, table=True):
     """
 
     __tablename__: str = "viewer_sightings"
+    # "Every sighting of this login name" is the lookup we care about; leading with the name covers
+    # it, and the fetch id lets joins out to the fetch (and its timestamp) come from the index.
+    __table_args__ = (
+        Index(
+            "ix_viewer_sightings_login_name_fetch_id",
+            "viewer_login_name",
+            "viewerlist_fetch_id",
+        ),
+    )
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(
+        default_factory=uuid7_from_pool, primary_key=True, sa_type=UUIDBinary
+    )
 
     viewerlist_fetch_id: UUID = Field(
-        foreign_key="stream_viewerlist_fetch.fetch_id", nullable=False
+        foreign_key="stream_viewerlist_fetch.fetch_id",
+        nullable=False,
+        sa_type=UUIDBinary,
+    )
+
+    stream_viewerlist_fetch: Optional["StreamViewerListFetch"] = Relationship(
+        back_populates="viewer_sightings"
     )
 
 
@@ -67,4 +101,6 @@ class ViewerSightingCreate(ViewerSightingBase):
 class ViewerSightingRead(ViewerSightingBase):
     """Model for returning Viewer Sighting data from the db."""
 
+    model_config = cast(SQLModelConfig, {"frozen": True})
+
     ID: UUID
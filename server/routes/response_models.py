@@ -0,0 +1,9 @@
+# /server/routes/response_models.py
+from pydantic import BaseModel
+
+from server.models import GetStreamResponse
+
+
+class StreamsPage(BaseModel):
+    streams: list[GetStreamResponse]
+    cursor: str
@@ -2,11 +2,13 @@ import logging
 from datetime import datetime, timezone
 from typing import Optional
 
+import orjson
 import pytz
-from fastapi import APIRouter, HTTPException, Query, Request, status
-from pydantic import ValidationError
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter, ValidationError
 
 from server.config import Config
+from server.core.scan_conductor import ScanConductor
 from server.core.twitch_api_delegate import (
     TwitchAPIConfig,
     TwitchGetStreamsParams,
@@ -20,19 +22,27 @@ from server.core.twitch_secrets_manager import TwitchSecretsManager
 from server.models import StreamCategoryCreate
 
 from .request_models import StringList
+from .response_models import StreamsPage
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_CATEGORY_LIST_ADAPTER = TypeAdapter(list[StreamCategoryCreate])
+
 
 @router.post("/store-token")
 async def store_token(request: Request):
-    if not await request.json():
+    # Decode the body once with orjson; the payload then goes straight into SecretCreate.
+    try:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload") from e
+
+    if not payload:
         raise HTTPException(status_code=400, detail="Missing JSON payload")
 
     try:
-        payload = await request.json()
         secrets_manager = TwitchSecretsManager()
         await secrets_manager.process_token_update_from_servlet(payload)
     except ValidationError as e:
@@ -137,11 +147,10 @@ async def get_streams_endpoint(
 
         print(f"{pagination_cursor=} {streams_response=}", flush=True)
 
-        # Return the first page of the response
-        return {
-            "streams": [s.model_dump() for s in streams_response],
-            "cursor": pagination_cursor,
-        }
+        # Return the first page of the response. These are already validated models, so let
+        # pydantic write the JSON directly instead of dumping to dicts for FastAPI to re-encode.
+        page = StreamsPage(streams=streams_response, cursor=pagination_cursor)
+        return Response(content=page.model_dump_json(), media_type="application/json")
     except ValidationError as e:
         logger.error(f"Validation error: {e.errors()}")
         raise HTTPException(
@@ -165,7 +174,9 @@ async def get_user_endpoint(username: str):
 
         # Return the user information
         if user_response is not None:
-            return user_response.model_dump()
+            return Response(
+                content=user_response.model_dump_json(), media_type="application/json"
+            )
 
         return {"message": "User not found."}
     except ValidationError as e:
@@ -194,8 +205,12 @@ async def get_categories_endpoint(
         # Call the delegate function
         categories = await get_categories(config, category_ids, category_names)
 
-        # Return the categories information
-        return [category.model_dump() for category in categories]
+        # Return the categories information. Returning a Response skips FastAPI's re-validation
+        # against response_model (which stays on the route for the OpenAPI docs).
+        return Response(
+            content=_CATEGORY_LIST_ADAPTER.dump_json(categories),
+            media_type="application/json",
+        )
     except ValidationError as e:
         logger.error(f"Validation error: {e.errors()}")
         raise HTTPException(
@@ -211,8 +226,6 @@ async def get_categories_endpoint(
 
 @router.post("/smoketest/")
 async def smoketest(channel_list: StringList):
-    from server.core.scan_conductor import ScanConductor
-
     logger.debug(f"SMOKETEST: {channel_list.items}")
 
     secrets_manager = TwitchSecretsManager()
@@ -6,6 +6,7 @@ from .redis_shared_queue import (
     RedisSharedQueueFull,
     get_redis_shared_queue,
 )
+from .token_bucket import TokenBucket
 from .twitch_util import convert_timestamp_from_twitch
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "RedisSharedQueueError",
     "RedisSharedQueueFull",
     "setup_logging",
+    "TokenBucket",
 ]
@@ -1,18 +1,17 @@
 import logging.config
 import os
-from typing import Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-class CustomFormatter(logging.Formatter):
-    def format(self, record):
-        record.module = record.module
-        record.funcName = record.funcName
-        return super().format(record)
 
-
-_LOG_FORMAT = "%(asctime)s - %(levelname)s - %(module)s::%(funcName)s - %(message)s"
+_LOG_FORMAT = (
+    "%(asctime)s - [%(process)d] %(levelname)s - %(module)s::%(funcName)s - %(message)s"
+)
 
 
 def _extract_filenames_from_logger_config(logger_config: dict) -> list:
@@ -25,24 +24,23 @@ def _extract_filenames_from_logger_config(logger_config: dict) -> list:
     return filenames
 
 
-def setup_logging(loggin_config_yaml_filepath: str) -> None:
-    if os.path.exists(loggin_config_yaml_filepath):
+def setup_logging(loggin_config_yaml_filepath: str | os.PathLike) -> None:
+    try:
         with open(loggin_config_yaml_filepath, "rt", encoding="UTF8") as config_file:
-            config: Union[list, dict, None] = yaml.safe_load(config_file.read())
-            if not isinstance(config, dict):
-                raise TypeError(f"logging config is {type(config)} but needs be dict.")
-            logging.config.dictConfig(config)
-
-            log_files: list = _extract_filenames_from_logger_config(config)
-
-            print(f"Log file(s) are at: {log_files}", flush=True)
-    else:
+            config: list | dict | None = yaml.load(config_file, Loader=_YamlLoader)
+    except FileNotFoundError:
         print("Log config not found, using defaults.", flush=True)
         logging.basicConfig(level=logging.DEBUG)
+    else:
+        if not isinstance(config, dict):
+            raise TypeError(f"logging config is {type(config)} but needs be dict.")
+        logging.config.dictConfig(config)
+
+        log_files: list = _extract_filenames_from_logger_config(config)
+
+        print(f"Log file(s) are at: {log_files}", flush=True)
 
-    # Create a custom formatter with the desired format
-    custom_formatter = CustomFormatter(_LOG_FORMAT)
+    formatter = logging.Formatter(_LOG_FORMAT)
 
-    # Add the custom formatter to all handlers
     for handler in logging.getLogger().handlers:
-        handler.setFormatter(custom_formatter)
+        handler.setFormatter(formatter)
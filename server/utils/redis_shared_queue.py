@@ -16,13 +16,13 @@
         - Dequeue as you like.
 """
 import asyncio
-import json
 import logging
 from dataclasses import dataclass, field
 from multiprocessing import Lock as multi_proc_lock
 from multiprocessing import Manager as multi_proc_manager
 from typing import Any, Optional, Union
 
+import orjson
 import redis.asyncio as redis_async
 from redis.exceptions import ConnectionError as RedisConnectionError
 from redis.exceptions import InvalidResponse as RedisInvalidResponse
@@ -233,8 +233,9 @@ class RedisSharedQueue:
         """
         async with self._asyncio_lock:
             with self._multiprocess_lock:
+                data: Union[str, bytes]
                 if isinstance(item, dict):
-                    data: str = json.dumps(item)
+                    data = orjson.dumps(item)
                 else:
                     data = str(item)
                 try:
@@ -287,8 +288,8 @@ class RedisSharedQueue:
                     item.decode("utf-8") if isinstance(item, bytes) else item
                 )
                 try:
-                    json_data: dict[str, str] = json.loads(raw_data)
-                except json.JSONDecodeError:
+                    json_data: dict[str, str] = orjson.loads(raw_data)
+                except orjson.JSONDecodeError:
                     json_data = {}
                 return_value = (raw_data, json_data)
         except (
@@ -1,12 +1,14 @@
-from datetime import datetime
-
-import pytz
+import functools
+from datetime import datetime, timezone
 
 
+# A scan sees the same whole-second timestamps over and over, so the parses are memoized.
+# Strings that don't parse raise, and lru_cache doesn't cache those.
+@functools.lru_cache(maxsize=10_000)
 def convert_timestamp_from_twitch(date_str: str) -> str:
-    # Parse the date string to a naive datetime object
+    # Parse Twitch's "2024-05-01T12:34:56Z" to a naive datetime object; anything else raises
     dt_naive = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
     # Make the datetime object timezone-aware
-    dt_aware = dt_naive.replace(tzinfo=pytz.UTC)
+    dt_aware = dt_naive.replace(tzinfo=timezone.utc)
     # Format the datetime object to the desired string format
     return dt_aware.strftime("%Y-%m-%d %H:%M:%S%z")
@@ -5,8 +5,7 @@ import logging
 import pytest
 import pytest_asyncio
 import redis.asyncio as redis_async
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 from sqlalchemy.sql import text
 from sqlmodel import SQLModel
@@ -83,7 +82,7 @@ async def async_engine():
 
 @pytest_asyncio.fixture(scope="session")
 async def async_session_maker(async_engine):  # pylint:disable=redefined-outer-name
-    return sessionmaker(async_engine, expire_on_commit=True, class_=AsyncSession)
+    return async_sessionmaker(async_engine, expire_on_commit=True)
 
 
 @pytest_asyncio.fixture(scope="session", autouse=True)
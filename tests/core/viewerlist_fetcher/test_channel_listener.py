@@ -2,6 +2,7 @@
 # pylint: disable=redefined-outer-name
 import asyncio
 import logging
+from time import perf_counter
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -12,7 +13,9 @@ from server.core.viewerlist_fetcher import (
     VLFetcherChannelJoinError,
 )
 from server.core.viewerlist_fetcher.channel_listener import (
+    OVERALL_TIMEOUT,
     ViewerListFetcherChannelListener,
+    VLFetcherOvertimeError,
 )
 
 logger = logging.getLogger("__name__")
@@ -95,6 +98,16 @@ async def test_event_raw_data_chatter_list_message_no_names(fetcher):
     assert len(fetcher._user_lists["test_channel"].user_names) == 0
 
 
+@pytest.mark.asyncio
+async def test_event_raw_data_ignores_unrelated_frames(fetcher):
+    fetcher._user_lists = {"test_channel": ViewerListFetchData()}
+    message = ":user353!user353@user353.tmi.twitch.tv PRIVMSG #test_channel :hi"
+
+    await fetcher.event_raw_data(message)
+
+    assert len(fetcher._user_lists["test_channel"].user_names) == 0
+
+
 @pytest.mark.asyncio
 async def test_event_raw_data_leave_channel_message(fetcher):
     with patch.object(
@@ -143,7 +156,7 @@ async def test_wait_for_user_list(fetcher):
 
     async def set_done():
         await asyncio.sleep(0.2)
-        fetcher._user_lists["test_channel"].done = True
+        fetcher._user_lists["test_channel"].mark_done()
 
     asyncio.create_task(set_done())
     await fetcher._wait_for_user_list("test_channel")
@@ -151,6 +164,16 @@ async def test_wait_for_user_list(fetcher):
     assert fetcher._user_lists["test_channel"].done is True
 
 
+@pytest.mark.asyncio
+async def test_wait_for_user_list_timeout(fetcher):
+    fetcher._user_lists["test_channel"] = ViewerListFetchData(
+        start_time=perf_counter() - OVERALL_TIMEOUT + 0.1
+    )
+
+    with pytest.raises(VLFetcherOvertimeError):
+        await fetcher._wait_for_user_list("test_channel")
+
+
 @pytest.mark.asyncio
 async def test_process_channel_task(fetcher):
     fetcher._join_channel = AsyncMock()
@@ -204,3 +227,27 @@ async def test_fetch_viewer_list_for_channels_vs_mixed_case(fetcher):
     assert set(result.keys()) == set(c.lower() for c in channels)
     assert isinstance(result["totallylegitusernametho"], ViewerListFetchData)
     assert elapsed > 0
+    fetcher._kick_off_listener_tasks.assert_called_once_with(
+        ["totallylegitusernametho"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_viewer_list_for_channels_rejects_non_str(fetcher):
+    fetcher._kick_off_listener_tasks = AsyncMock()
+
+    with pytest.raises(TypeError):
+        await fetcher.fetch_viewer_list_for_channels(["channel1", b"channel2"])
+
+    fetcher._kick_off_listener_tasks.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fetch_viewer_list_for_channels_dedupes(fetcher):
+    channels = ["channel1", "Channel1", "channel2"]
+    fetcher._kick_off_listener_tasks = AsyncMock()
+
+    result, _ = await fetcher.fetch_viewer_list_for_channels(channels)
+
+    assert set(result.keys()) == {"channel1", "channel2"}
+    fetcher._kick_off_listener_tasks.assert_called_once_with(["channel1", "channel2"])
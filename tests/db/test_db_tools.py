@@ -1,7 +1,7 @@
 import pytest
 from sqlmodel import select
 
-from server.db import upsert_one
+from server.db import insert_many, upsert_one
 from server.models.sqlmodel.dummy_model import DummyModel
 
 
@@ -39,3 +39,37 @@ async def test_upsert_update(async_session):
     retrieved = result.scalar_one()
     assert retrieved.name == "Test Updated"
     assert retrieved.value == 200
+
+
+@pytest.mark.asyncio
+async def test_insert_many(async_session):
+    rows = [{"id": i, "name": f"Test{i}", "value": i * 100} for i in range(1, 6)]
+
+    await insert_many(DummyModel, rows, session=async_session)
+
+    result = await async_session.execute(select(DummyModel).order_by(DummyModel.id))
+    retrieved = result.scalars().all()
+    assert [(r.id, r.name, r.value) for r in retrieved] == [
+        (row["id"], row["name"], row["value"]) for row in rows
+    ]
+
+
+@pytest.mark.asyncio
+async def test_insert_many_in_batches(async_session):
+    rows = [{"id": i, "name": f"Test{i}", "value": i} for i in range(1, 8)]
+
+    await insert_many(DummyModel, rows, session=async_session, batch_size=3)
+
+    result = await async_session.execute(select(DummyModel).order_by(DummyModel.id))
+    assert [r.id for r in result.scalars().all()] == list(range(1, 8))
+
+
+@pytest.mark.asyncio
+async def test_insert_many_leaves_commit_to_callers_session(async_session):
+    rows = [{"id": i, "name": f"Test{i}", "value": i} for i in range(1, 8)]
+
+    await insert_many(DummyModel, rows, session=async_session, batch_size=3)
+    await async_session.rollback()
+
+    result = await async_session.execute(select(DummyModel))
+    assert result.scalars().all() == []
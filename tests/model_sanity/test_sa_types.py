@@ -0,0 +1,53 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from sqlalchemy.dialects import mysql
+
+from server.models._sa_types import EpochMicros, SecondsAsMicros, UUIDBinary
+
+
+def test_uuid_binary_round_trip():
+    uuid_type = UUIDBinary()
+    dialect = mysql.dialect()
+    value = uuid4()
+
+    stored = uuid_type.process_bind_param(value, dialect)
+    assert stored == value.bytes
+    assert len(stored) == 16
+    assert uuid_type.process_result_value(stored, dialect) == value
+
+
+def test_uuid_binary_accepts_strings_bytes_and_none():
+    uuid_type = UUIDBinary()
+    dialect = mysql.dialect()
+    value = uuid4()
+
+    assert uuid_type.process_bind_param(str(value), dialect) == value.bytes
+    assert uuid_type.process_bind_param(value.bytes, dialect) == value.bytes
+    assert uuid_type.process_bind_param(None, dialect) is None
+    assert uuid_type.process_result_value(None, dialect) is None
+
+
+def test_seconds_as_micros_round_trip():
+    micros_type = SecondsAsMicros()
+    dialect = mysql.dialect()
+
+    stored = micros_type.process_bind_param(1.2345678, dialect)
+    assert stored == 1_234_568
+    assert micros_type.process_result_value(stored, dialect) == 1.234568
+    assert micros_type.process_bind_param(None, dialect) is None
+    assert micros_type.process_result_value(None, dialect) is None
+
+
+def test_epoch_micros_round_trip():
+    micros_type = EpochMicros()
+    dialect = mysql.dialect()
+    value = datetime(2021, 3, 10, 15, 4, 21, 123456, tzinfo=timezone.utc)
+
+    stored = micros_type.process_bind_param(value, dialect)
+    assert stored == 1_615_388_661_123_456
+    assert micros_type.process_result_value(stored, dialect) == value
+    # naive datetimes are taken to be UTC
+    assert micros_type.process_bind_param(value.replace(tzinfo=None), dialect) == stored
+    assert micros_type.process_bind_param(None, dialect) is None
+    assert micros_type.process_result_value(None, dialect) is None
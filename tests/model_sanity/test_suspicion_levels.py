@@ -0,0 +1,30 @@
+import pytest
+
+from server.models import (
+    SUSPICION_RANKING_THRESHOLDS,
+    SuspicionLevel,
+    classify_suspicion_level,
+)
+
+
+@pytest.mark.parametrize(
+    "channel_count, expected",
+    [
+        (0, SuspicionLevel.NONE),
+        (1, SuspicionLevel.NONE),
+        (10, SuspicionLevel.NONE),
+        (11, SuspicionLevel.GREY),
+        (100, SuspicionLevel.PURPLE),
+        (101, SuspicionLevel.BLUE),
+        (100001, SuspicionLevel.RED),
+        (99999999, SuspicionLevel.RED),
+    ],
+)
+def test_classify_suspicion_level(channel_count, expected):
+    assert classify_suspicion_level(channel_count) == expected
+
+
+def test_classify_suspicion_level_agrees_with_thresholds():
+    for (low, high), level in SUSPICION_RANKING_THRESHOLDS.items():
+        assert classify_suspicion_level(low) == level
+        assert classify_suspicion_level(high) == level
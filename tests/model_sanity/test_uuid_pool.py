@@ -0,0 +1,21 @@
+import time
+
+from server.models._uuid_pool import _UUIDS_PER_REFILL, uuid7_from_pool
+
+
+def test_uuid7_from_pool_makes_valid_uuid7s():
+    before_ms = time.time_ns() // 1_000_000
+    uuid = uuid7_from_pool()
+    after_ms = time.time_ns() // 1_000_000
+
+    assert uuid.version == 7
+    assert str(uuid)[19] in "89ab"  # RFC 4122 variant
+    assert before_ms <= uuid.int >> 80 <= after_ms + 1
+
+
+def test_uuid7_from_pool_is_monotonic():
+    uuids = [uuid7_from_pool() for _ in range(_UUIDS_PER_REFILL * 3)]
+    assert uuids == sorted(uuids)
+    assert len(set(uuids)) == len(uuids)
+    # BINARY(16) columns compare bytewise; that order has to match too
+    assert [uuid.bytes for uuid in uuids] == sorted(uuid.bytes for uuid in uuids)
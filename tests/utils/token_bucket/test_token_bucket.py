@@ -0,0 +1,51 @@
+import asyncio
+from time import monotonic
+
+import pytest
+
+from server.utils import TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_acquire_within_capacity_does_not_wait():
+    bucket = TokenBucket(capacity=5, refill_per_second=1.0)
+
+    start = monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+    assert monotonic() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_refill():
+    bucket = TokenBucket(capacity=2, refill_per_second=20.0)
+    await bucket.acquire(2)
+
+    start = monotonic()
+    await bucket.acquire(2)
+    elapsed = monotonic() - start
+    assert 0.08 <= elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_acquires_are_rate_limited():
+    bucket = TokenBucket(capacity=1, refill_per_second=50.0)
+
+    start = monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+    # first is free, the other five need 1/50s each
+    assert monotonic() - start >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_acquire_more_than_capacity_raises():
+    bucket = TokenBucket(capacity=3, refill_per_second=1.0)
+    with pytest.raises(ValueError):
+        await bucket.acquire(4)
+
+
+def test_invalid_config_raises():
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=0, refill_per_second=1.0)
+    with pytest.raises(ValueError):
+        TokenBucket(capacity=1, refill_per_second=0)
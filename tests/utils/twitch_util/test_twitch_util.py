@@ -0,0 +1,24 @@
+import pytest
+
+from server.utils import convert_timestamp_from_twitch
+
+
+def test_convert_timestamp_from_twitch():
+    assert (
+        convert_timestamp_from_twitch("2016-12-14T20:32:28Z")
+        == "2016-12-14 20:32:28+0000"
+    )
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "2016-12-14T20:32:28+02:00",  # Twitch always sends UTC with a Z
+        "2016-12-14",  # date only
+        "2016-12-14T20:32:28",  # naive
+        "",
+    ],
+)
+def test_convert_timestamp_from_twitch_rejects_other_formats(date_str):
+    with pytest.raises(ValueError):
+        convert_timestamp_from_twitch(date_str)
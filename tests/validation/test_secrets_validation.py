@@ -68,3 +68,10 @@ def test_secret_last_update_timestamp_default():
 
     assert isinstance(secret.last_update_timestamp, datetime)
     assert secret.last_update_timestamp <= datetime.now(timezone.utc)
+
+
+def test_secret_read_is_frozen():
+    secret_read = SecretRead(**VALID_SECRET_DATA, id=1)
+
+    with pytest.raises(ValidationError):
+        secret_read.id = 2